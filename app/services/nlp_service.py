@@ -1,11 +1,12 @@
 import os
 import json
 import math
+from functools import lru_cache
 from typing import Dict
 
 import google.generativeai as genai
 from dotenv import load_dotenv
-from .solver_factory import create_solver
+from .solver_factory import solve_circuit
 
 # ---------------------------------------------------------------------------
 # Environment & model configuration
@@ -19,6 +20,35 @@ except KeyError as exc:
 
 MODEL_NAME = os.environ.get("GEMINI_MODEL_NAME", "gemini-flash-latest")
 
+# The reply is constrained to this schema so it always parses as JSON. It
+# merges the two reply formats described in SYSTEM_PROMPT below.
+RESPONSE_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "supported": {"type": "boolean"},
+        "reason": {"type": "string", "nullable": True},
+        "rectifier_type": {"type": "string", "enum": ["half_wave", "full_wave"], "nullable": True},
+        "control_type": {"type": "string", "enum": ["controlled", "uncontrolled"], "nullable": True},
+        "freewheeling_diode": {"type": "boolean", "nullable": True},
+        "R_load": {"type": "number", "nullable": True},
+        "L_load": {"type": "number", "nullable": True},
+        "E_load": {"type": "number", "nullable": True},
+        "source_voltage_vrms": {"type": "number", "nullable": True},
+        "source_frequency_hz": {"type": "number", "nullable": True},
+        "firing_angle_alpha": {"type": "number", "nullable": True},
+    },
+    "required": ["supported"],
+}
+
+# Built once and shared by every request.
+_MODEL = genai.GenerativeModel(
+    MODEL_NAME,
+    generation_config={
+        "response_mime_type": "application/json",
+        "response_schema": RESPONSE_SCHEMA,
+    },
+)
+
 # ---------------------------------------------------------------------------
 # Prompt template
 # ---------------------------------------------------------------------------
@@ -65,6 +95,17 @@ Return ONLY a JSON object. Do not add any other text.
 # Public helpers
 # ---------------------------------------------------------------------------
 
+@lru_cache(maxsize=512)
+def _extract_params(user_query: str) -> str:
+    """Return Gemini's raw JSON reply for *user_query*.
+
+    Replies are memoised per query string, so resubmitting the same
+    description does not make another network round-trip.
+    """
+    response = _MODEL.generate_content([SYSTEM_PROMPT, user_query])
+    return response.text
+
+
 def process_query(user_query: str) -> Dict:
     """Process an end-user textual query via Gemini and solve the rectifier.
 
@@ -77,12 +118,8 @@ def process_query(user_query: str) -> Dict:
     # ---------------------------------------------------------------------
     # 1. Let Gemini extract & normalise the circuit description
     # ---------------------------------------------------------------------
-    model = genai.GenerativeModel(MODEL_NAME)
-    response = model.generate_content([SYSTEM_PROMPT, user_query])
-
-    cleaned_text = response.text.strip().replace("```json", "").replace("```", "")
     try:
-        params = json.loads(cleaned_text)
+        params = json.loads(_extract_params(user_query))
     except json.JSONDecodeError:
         return {
             "supported": False,
@@ -135,10 +172,10 @@ def process_query(user_query: str) -> Dict:
     Vdc = float(params.get("E_load") or 0)
     firing_angle = float(params.get("firing_angle_alpha") or 0)
 
-    solver = create_solver(
+    results = solve_circuit(
         wave_type=wave_type,
         control_type=control_type,
-        is_fwd=is_fwd,
+        is_fwd=bool(is_fwd),
         Vm=Vm,
         f=f,
         R=R,
@@ -147,12 +184,10 @@ def process_query(user_query: str) -> Dict:
         firing_angle=firing_angle,
     )
 
-    if not solver:
+    if results is None:
         return {
             "supported": False,
             "reason": "The identified circuit configuration is not supported by any available solver.",
         }
 
-    results = solver.solve()
-
     return {"supported": True, "results": results, "extracted_params": params} 
\ No newline at end of file
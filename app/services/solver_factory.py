@@ -1,3 +1,7 @@
+from functools import lru_cache
+
+import numpy as np
+
 from app.solvers import (
     UncontrolledHalfWaveSolver as UHW,
     ControlledHalfWaveSolver as CHW,
@@ -5,11 +9,27 @@ from app.solvers import (
     UncontrolledFullWaveSolver as UFW,
     ControlledFullWaveSolver as CFW,
 )
+from app.solvers.base_solver import minimum_firing_angle, inoperative_results
 
 __all__ = [
     "create_solver",
+    "solve_circuit",
 ]
 
+# (wave_type, control_type, is_fwd) -> constructor taking
+# (circuit_type, Vm, f, R, L, Vdc, firing_angle).
+# The freewheeling diode only changes the solver for the uncontrolled half wave.
+_DISPATCH = {
+    ("half", "uncontrolled", True): lambda c, Vm, f, R, L, Vdc, a: FWHW(c, Vm, f, R, L),
+    ("half", "uncontrolled", False): lambda c, Vm, f, R, L, Vdc, a: UHW(c, Vm, f, R, L, Vdc),
+    ("half", "controlled", True): CHW,
+    ("half", "controlled", False): CHW,
+    ("full", "uncontrolled", True): lambda c, Vm, f, R, L, Vdc, a: UFW(c, Vm, f, R, L, Vdc),
+    ("full", "uncontrolled", False): lambda c, Vm, f, R, L, Vdc, a: UFW(c, Vm, f, R, L, Vdc),
+    ("full", "controlled", True): CFW,
+    ("full", "controlled", False): CFW,
+}
+
 
 def create_solver(
     *,
@@ -48,22 +68,102 @@ def create_solver(
     """
 
     # Normalise wave type string
-    wave_type = wave_type.replace("_wave", "")
+    wave_type = wave_type.removesuffix("_wave")
+
+    constructor = _DISPATCH.get((wave_type, control_type, bool(is_fwd)))
+    if constructor is None:
+        return None
 
     circuit_type = "fwd" if is_fwd else "rle"
-    solver = None
-
-    if wave_type == "half":
-        if is_fwd and control_type == "uncontrolled":
-            solver = FWHW(circuit_type, Vm, f, R, L)
-        elif control_type == "uncontrolled":
-            solver = UHW(circuit_type, Vm, f, R, L, Vdc)
-        elif control_type == "controlled":
-            solver = CHW(circuit_type, Vm, f, R, L, Vdc, firing_angle)
-    elif wave_type == "full":
-        if control_type == "uncontrolled":
-            solver = UFW(circuit_type, Vm, f, R, L, Vdc)
-        elif control_type == "controlled":
-            solver = CFW(circuit_type, Vm, f, R, L, Vdc, firing_angle)
-
-    return solver 
\ No newline at end of file
+    return constructor(circuit_type, Vm, f, R, L, Vdc, firing_angle)
+
+def solve_circuit(
+    *,
+    wave_type: str,
+    control_type: str,
+    is_fwd: bool,
+    Vm: float,
+    f: float,
+    R: float,
+    L: float,
+    Vdc: float,
+    firing_angle: float,
+):
+    """Solve the given rectifier configuration, memoising the results.
+
+    Takes the same arguments as :func:`create_solver`. Identical parameter
+    sets (e.g. the same form submitted twice) are served from the cache.
+    Each caller gets its own dictionaries, so editing them cannot leak into
+    later responses; the waveform arrays are shared and read-only.
+
+    Returns
+    -------
+    dict | None
+        The solver results or ``None`` if the combination is unsupported.
+    """
+    results = _solve_circuit_cached(
+        wave_type=wave_type,
+        control_type=control_type,
+        is_fwd=is_fwd,
+        Vm=Vm,
+        f=f,
+        R=R,
+        L=L,
+        Vdc=Vdc,
+        firing_angle=firing_angle,
+    )
+    if results is None:
+        return None
+
+    return {group: dict(values) for group, values in results.items()}
+
+
+@lru_cache(maxsize=1024)
+def _solve_circuit_cached(
+    *,
+    wave_type: str,
+    control_type: str,
+    is_fwd: bool,
+    Vm: float,
+    f: float,
+    R: float,
+    L: float,
+    Vdc: float,
+    firing_angle: float,
+):
+    """Cached body of :func:`solve_circuit`.
+
+    The returned dictionary is shared between calls and must not be mutated;
+    its waveform arrays are marked read-only to catch accidental writes.
+    """
+    # A controlled rectifier fired before alpha_min never conducts; its flat
+    # results do not depend on the load, so no solver needs to be built.
+    key = (wave_type.removesuffix("_wave"), control_type, bool(is_fwd))
+    if (
+        key in _DISPATCH
+        and control_type == "controlled"
+        and firing_angle < minimum_firing_angle(Vm, Vdc)
+    ):
+        return inoperative_results(Vm, Vdc, firing_angle)
+
+    solver = create_solver(
+        wave_type=wave_type,
+        control_type=control_type,
+        is_fwd=is_fwd,
+        Vm=Vm,
+        f=f,
+        R=R,
+        L=L,
+        Vdc=Vdc,
+        firing_angle=firing_angle,
+    )
+
+    if not solver:
+        return None
+
+    results = solver.solve()
+    for trace in results["waveforms"].values():
+        if isinstance(trace, np.ndarray):
+            trace.flags.writeable = False
+
+    return results
@@ -1,5 +1,140 @@
+import math
+from functools import lru_cache
+
 import numpy as np
-from scipy.optimize import fsolve
+
+# Number of samples per waveform trace sent to the frontend. With an odd
+# count over 0..2π, π falls exactly on the middle sample, so both half-cycles
+# start and end on a grid point.
+WAVEFORM_POINTS = 257
+
+# The waveform grid and the unit source voltage on it are the same for every
+# solve, so they are built once and shared (read-only)
+WAVEFORM_WT = np.linspace(0, 2*np.pi, WAVEFORM_POINTS)
+WAVEFORM_SIN_WT = np.sin(WAVEFORM_WT)
+WAVEFORM_WT.flags.writeable = False
+WAVEFORM_SIN_WT.flags.writeable = False
+
+def find_extinction_angle(current_function, start, stop, num_points=256):
+    """Return the first angle in (start, stop] where the current returns to zero.
+
+    The window is scanned on a coarse grid to bracket the first sign change,
+    which is then refined with ``brentq``. ``start`` is returned when the current
+    never rises above zero and ``stop`` when it never falls back to zero.
+    """
+    wt = np.linspace(start, stop, num_points + 1)[1:]
+    not_conducting = np.flatnonzero(current_function(wt) <= 0)
+    if not_conducting.size == 0:
+        return stop
+
+    k = not_conducting[0]
+    if k > 0:
+        lower = wt[k - 1]
+    else:
+        # The crossing lies within the first step: start just past ``start``
+        # (where the current is zero by construction) if it conducts at all.
+        lower = start + 1e-9 * (stop - start)
+        if current_function(np.array([lower]))[0] <= 0:
+            return start
+
+    # SciPy is slow to import and the freewheeling solver never needs it,
+    # so it is loaded on the first extinction angle that needs refining
+    from scipy.optimize import brentq
+    return brentq(lambda x: current_function(np.array([x]))[0], lower, wt[k], xtol=1e-12)
+
+
+def minimum_firing_angle(Vm, Vdc):
+    """Return alpha_min, the earliest angle at which the source exceeds Vdc."""
+    return max(0.0, math.asin(max(-1.0, min(1.0, Vdc/Vm))))
+
+
+def conduction_integrals(a, d, tau, theta, alpha, beta):
+    """Return the integrals of i and i² over the conduction interval alpha..beta.
+
+    While conducting, i(wt) = a*sin(wt - theta) - d + K*exp(-(wt - alpha)/tau),
+    with a = Vm/Z, d = Vdc/R, tau = wTau and K = -i_forced(alpha) making the
+    current start from zero. Every cross term has an elementary antiderivative,
+    so both integrals are exact. alpha and beta may be arrays of equal shape.
+    """
+    span = beta - alpha
+    s0, c0 = np.sin(alpha - theta), np.cos(alpha - theta)
+    s1, c1 = np.sin(beta - theta), np.cos(beta - theta)
+    
+    # Steady-state terms: ∫sin, ∫sin²
+    sin_int = c0 - c1
+    sin_sq_int = span/2 - (s1*c1 - s0*c0)/2
+    
+    current_int = a*sin_int - d*span
+    current_sq_int = a*a*sin_sq_int - 2*a*d*sin_int + d*d*span
+    
+    if tau > 0:
+        K = d - a*s0  # Transient amplitude at alpha
+        decay = np.exp(-span/tau)
+        # ∫exp, ∫exp², ∫sin·exp over alpha..beta
+        exp_int = tau * (1 - decay)
+        exp_sq_int = tau/2 * (1 - decay*decay)
+        sin_exp_int = tau * ((s0 + tau*c0) - (s1 + tau*c1)*decay) / (1 + tau*tau)
+        
+        current_int += K*exp_int
+        current_sq_int += K*K*exp_sq_int + 2*a*K*sin_exp_int - 2*d*K*exp_int
+    
+    return current_int, current_sq_int
+
+
+@lru_cache(maxsize=256)
+def _inoperative_waveforms(Vm, Vdc):
+    """Return the read-only flat traces of a rectifier that never conducts."""
+    wt = WAVEFORM_WT.astype(np.float32)
+    vs = (Vm * WAVEFORM_SIN_WT).astype(np.float32)
+    vo = np.full_like(wt, Vdc)
+    zeros = np.zeros_like(wt)
+    waveforms = (wt, vs, vo, vs - vo, zeros)
+    for trace in waveforms:
+        trace.flags.writeable = False
+    return waveforms
+
+
+def inoperative_results(Vm, Vdc, alpha):
+    """Return the results of a controlled rectifier fired before alpha_min.
+
+    The thyristor never turns on: no current flows and the output stays at
+    Vdc, so everything is flat except the source voltage. Each call returns
+    a fresh dictionary; only its read-only waveform arrays are cached and
+    shared.
+    """
+    wt, vs, vo, vd, zeros = _inoperative_waveforms(Vm, Vdc)
+    waveforms = {
+        'time': wt,
+        'vs': vs,
+        'vo': vo,
+        'vd': vd,
+        'i_out': zeros,
+        'vl': zeros,
+        'vr': zeros
+    }
+    
+    return {
+        'parameters': {
+            'alpha': alpha,
+            'beta': alpha,
+            'A': 0,
+            'conducting_angle': 0,
+            'conducting_time': 0
+        },
+        'performance': {
+            'Iavg': 0,
+            'Irms': 0,
+            'Vavg': Vdc,  # Output voltage remains at Vdc
+            'Vrms': Vdc,
+            'power_factor': 0,
+            'form_factor': 1,  # Vrms/Vavg = 1 for DC
+            'ripple_factor': 0,
+            'efficiency': 0,
+            'power': 0
+        },
+        'waveforms': waveforms
+    }
+
 
 class BaseRectifierSolver:
     """Base class for all rectifier solvers"""
@@ -8,15 +143,23 @@ class BaseRectifierSolver:
         self.circuit_type = circuit_type
         self.Vm = Vm  # Peak source voltage
         self.f = f  # Frequency
-        self.w = 2 * np.pi * f  # Angular frequency
+        self.w = 2 * math.pi * f  # Angular frequency
         self.R = R  # Resistance
         self.L = L  # Inductance
         self.Vdc = Vdc  # DC voltage
-        self.Z = np.sqrt(R**2 + (self.w*L)**2)  # Impedance
-        self.theta = np.arctan(self.w*L/R)  # Phase angle
+        self.Vs_rms = Vm / math.sqrt(2)  # RMS source voltage
+        self.Z = math.hypot(R, self.w*L)  # Impedance
+        self.theta = math.atan2(self.w*L, R)  # Phase angle
         self.tau = L/R  # Time constant
         self.wTau = self.w * self.tau  # Normalized time constant
         
+        # Ratios reused by every current evaluation
+        self.Vm_over_Z = Vm / self.Z  # Peak of the steady-state current
+        self.Vdc_over_R = Vdc / R  # Current drawn by the DC source
+        # Decay rate of the transient; it only ever scales decaying terms,
+        # exp(-(wt - alpha)*inv_wTau), never a growing exponential
+        self.inv_wTau = 1 / self.wTau if self.wTau > 0 else np.inf
+        
         # Results initialized with default values
         self.alpha = 0
         self.beta = 0
@@ -37,29 +180,68 @@ class BaseRectifierSolver:
         """Each derived solver must implement its own solve method"""
         raise NotImplementedError("Derived classes must implement solve()")
     
-    def current_function(self, wt):
-        """Calculate the current at angular position wt"""
-        return (self.Vm/self.Z) * np.sin(wt - self.theta) - self.Vdc/self.R + self.A * np.exp(-wt/self.wTau)
+    def transient_current(self, wt):
+        """Calculate the decaying term A*exp(-(wt-alpha)/wTau) of the current at wt (an array)
+
+        A is the transient's value at alpha, so the exponential only decays
+        over the conduction interval and cannot overflow for small wTau.
+        """
+        # A purely resistive load (wTau = 0) has no transient term
+        if self.wTau == 0:
+            return np.zeros_like(wt, dtype=float)
+        
+        transient = np.subtract(self.alpha, wt)
+        transient *= self.inv_wTau
+        np.exp(transient, out=transient)
+        transient *= self.A
+        return transient
+    
+    def current_function(self, wt, transient=None):
+        """Calculate the current at angular positions wt (an array)
+
+        ``transient`` may carry transient_current(wt) when the caller already
+        has it, so the exponential is not evaluated twice.
+        """
+        # Evaluated in place on two buffers instead of one temporary per operation
+        i = np.subtract(wt, self.theta)
+        np.sin(i, out=i)
+        i *= self.Vm_over_Z
+        i -= self.Vdc_over_R
+        i += self.transient_current(wt) if transient is None else transient
+        return i
+    
+    def current_derivative(self, wt, transient=None):
+        """Calculate di/d(wt) at angular positions wt (an array) while conducting
+
+        Takes the same optional precomputed ``transient`` as current_function.
+        """
+        di = np.subtract(wt, self.theta)
+        np.cos(di, out=di)
+        di *= self.Vm_over_Z
+        
+        # d/d(wt) of A*exp(-(wt-alpha)/wTau) is -exp(...)*A/wTau
+        if self.wTau > 0:
+            if transient is None:
+                transient = self.transient_current(wt)
+            di -= transient * self.inv_wTau
+        return di
+    
+    def conduction_integrals(self):
+        """Return the integrals of i and i² over the conduction interval alpha..beta"""
+        return conduction_integrals(self.Vm_over_Z, self.Vdc_over_R, self.wTau, self.theta, self.alpha, self.beta)
     
     def solve_rectifier(self):
         """Common solving logic for all half-wave rectifiers"""
         # This method is called after firing angle (alpha) is set by the child class
         
-        # Step 2: Find A by setting i(alpha) = 0
-        def equation_for_A(A):
-            return (self.Vm/self.Z) * np.sin(self.alpha - self.theta) - self.Vdc/self.R + A * np.exp(-self.alpha/self.wTau)
-        
-        A_initial = [0.0]  # Initial guess
-        self.A = fsolve(equation_for_A, A_initial)[0]
-        
-        # Step 3: Find beta by setting i(beta) = 0
-        def equation_for_beta(beta):
-            return (self.Vm/self.Z) * np.sin(beta - self.theta) - self.Vdc/self.R + self.A * np.exp(-beta/self.wTau)
+        # Step 2: Find A by setting i(alpha) = 0; the transient is anchored at
+        # alpha, so A is simply minus the forced current there
+        # A purely resistive load (wTau = 0) has no transient term
+        forced_current = self.Vm_over_Z * np.sin(self.alpha - self.theta) - self.Vdc_over_R
+        self.A = -forced_current if self.wTau > 0 else 0.0
         
-        beta_initial = [np.pi]  # Initial guess
-        self.beta = fsolve(equation_for_beta, beta_initial)[0]
-        if self.beta < self.alpha:
-            self.beta += 2*np.pi  # Ensure beta > alpha
+        # Step 3: Find beta as the first zero of i after alpha (within one period)
+        self.beta = find_extinction_angle(self.current_function, self.alpha, self.alpha + 2*np.pi)
         
         # Calculate conducting angle and time
         self.conducting_angle = self.beta - self.alpha
@@ -67,39 +249,29 @@ class BaseRectifierSolver:
         self.conducting_time = 1000 * self.conducting_angle / self.w  # ms
         
         # Step 4: Calculate Average Current (Iavg)
-        num_points = 1000
-        t_values = np.linspace(self.alpha, self.beta, num_points)
-        current_values = self.current_function(t_values)
-        self.Iavg = np.trapz(current_values, t_values) / (2*np.pi)
+        current_int, current_sq_int = self.conduction_integrals()
+        self.Iavg = current_int / (2*np.pi)
         
         # Step 5: Calculate RMS Current (Irms)
-        squared_current = current_values**2
-        self.Irms = np.sqrt(np.trapz(squared_current, t_values) / (2*np.pi))
+        self.Irms = math.sqrt(max(current_sq_int, 0) / (2*np.pi))
         
         # Step 6: Calculate Average Voltage (Vavg)
-        num_points = 1000
-        
-        # Define the three regions and their voltage functions
-        t1 = np.linspace(0, self.alpha, num_points)
-        v1 = np.full_like(t1, self.Vdc)  # Vdc in region 1
-        
-        t2 = np.linspace(self.alpha, self.beta, num_points)
-        v2 = self.Vm * np.sin(t2)  # Vsource in region 2
+        # vo is Vdc outside alpha..beta and Vm*sin(wt) inside, so both
+        # integrals have closed forms:
+        #   ∫ sin(wt) dwt  = cos(alpha) - cos(beta)
+        #   ∫ sin²(wt) dwt = (beta - alpha)/2 - (sin(2beta) - sin(2alpha))/4
+        dc_span = 2*np.pi - (self.beta - self.alpha)
+        sin_integral = np.cos(self.alpha) - np.cos(self.beta)
+        sin_sq_integral = (self.beta - self.alpha)/2 - (np.sin(2*self.beta) - np.sin(2*self.alpha))/4
         
-        t3 = np.linspace(self.beta, 2*np.pi, num_points)
-        v3 = np.full_like(t3, self.Vdc)  # Vdc in region 3
-        
-        t_all = np.concatenate([t1, t2, t3])
-        v_all = np.concatenate([v1, v2, v3])
-        
-        self.Vavg = np.trapz(v_all, t_all) / (2*np.pi)
+        self.Vavg = (self.Vdc * dc_span + self.Vm * sin_integral) / (2*np.pi)
         
         # Step 7: Calculate RMS Voltage (Vrms)
-        self.Vrms = np.sqrt(np.trapz(v_all**2, t_all) / (2*np.pi))
+        self.Vrms = np.sqrt((self.Vdc**2 * dc_span + self.Vm**2 * sin_sq_integral) / (2*np.pi))
         
         # Step 8: Calculate Performance Metrics
         # Source RMS values
-        Vs_rms = self.Vm / np.sqrt(2)
+        Vs_rms = self.Vs_rms
         
         # Calculate power on load: VdcIavg + Irms²×R
         self.power = self.Vdc * self.Iavg + self.Irms**2 * self.R
@@ -127,49 +299,52 @@ class BaseRectifierSolver:
     def generate_waveforms(self):
         """Generate waveform data for visualization
         All waveforms are functions of angular position (wt)"""
-        wt = np.linspace(0, 2*np.pi, 1000)  # Angular position from 0 to 2π
+        # One contiguous buffer holds every trace; each row is a view into it
+        waveforms = np.empty((7, WAVEFORM_POINTS))
+        wt, vs, vo, vd, i_out, vl, vr = waveforms
+        wt[:] = WAVEFORM_WT  # Angular position from 0 to 2π
         
         # Source voltage
-        vs = self.Vm * np.sin(wt)
+        np.multiply(WAVEFORM_SIN_WT, self.Vm, out=vs)
         
         # Output voltage for half-wave rectifier with RLE load: 
-        # - Vdc from 0 to alpha
         # - Vsource from alpha to beta
-        # - Vdc from beta to 2π
-        vo = np.zeros_like(wt)
-        non_conducting_before = (wt < self.alpha)
-        conducting = (wt >= self.alpha) & (wt <= self.beta)
-        non_conducting_after = (wt > self.beta)
-        
-        vo[non_conducting_before] = self.Vdc
+        # - Vdc elsewhere
+        # wt is sorted, so the conduction interval is a contiguous slice
+        conducting = slice(np.searchsorted(wt, self.alpha), np.searchsorted(wt, self.beta, side='right'))
+        vo[:] = self.Vdc
         vo[conducting] = vs[conducting]
-        vo[non_conducting_after] = self.Vdc
         
         # Diode voltage (Vsource - Voutput)
-        vd = vs - vo
+        np.subtract(vs, vo, out=vd)
         
         # Current (0 before alpha and after beta)
-        i_out = np.zeros_like(wt)
-        i_out[conducting] = self.current_function(wt[conducting])
+        # The transient is shared by the current and its derivative
+        wt_on = wt[conducting]
+        transient = self.transient_current(wt_on)
+        i_out[:] = 0
+        i_out[conducting] = self.current_function(wt_on, transient)
         
-        # Inductor voltage (L * di/dt)
-        vl = np.zeros_like(wt)
-        # Use np.gradient to calculate di/dt, adjust for actual time by multiplying by angular frequency
-        if np.any(conducting):
-            di_dt = np.gradient(i_out[conducting], wt[conducting])
-            vl[conducting] = self.L * di_dt * self.w
+        # Inductor voltage (L * di/dt), zero while the diode is off
+        # di/d(wt) is converted to di/dt by multiplying by angular frequency
+        vl[:] = 0
+        vl[conducting] = self.L * self.w * self.current_derivative(wt_on, transient)
         
         # Resistor voltage (I*R)
-        vr = i_out * self.R
+        np.multiply(i_out, self.R, out=vr)
+        
+        # Plots do not need double precision: float32 halves the payload.
+        # The arrays are serialised directly by the app's JSON provider.
+        wt, vs, vo, vd, i_out, vl, vr = waveforms.astype(np.float32)
         
         return {
-            'time': wt.tolist(),
-            'vs': vs.tolist(),
-            'vo': vo.tolist(),
-            'vd': vd.tolist(),
-            'i_out': i_out.tolist(),
-            'vl': vl.tolist(),
-            'vr': vr.tolist()
+            'time': wt,
+            'vs': vs,
+            'vo': vo,
+            'vd': vd,
+            'i_out': i_out,
+            'vl': vl,
+            'vr': vr
         }
     
     def generate_results(self):
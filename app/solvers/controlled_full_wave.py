@@ -1,11 +1,17 @@
 import numpy as np
-from scipy.optimize import fsolve
-from .base_solver import BaseRectifierSolver
+from .base_solver import (
+    BaseRectifierSolver,
+    find_extinction_angle,
+    minimum_firing_angle,
+    inoperative_results
+)
 from .full_wave_utils import (
     solve_full_wave_continuous_mode,
     solve_full_wave_discontinuous_mode,
     calculate_full_wave_performance_metrics,
-    generate_full_wave_waveforms
+    generate_full_wave_waveforms,
+    continuous_current,
+    continuous_current_derivative
 )
 
 class ControlledFullWaveSolver(BaseRectifierSolver):
@@ -20,28 +26,17 @@ class ControlledFullWaveSolver(BaseRectifierSolver):
     def solve(self):
         """Implement the solution for controlled full-wave rectifier"""
         # Calculate the minimum possible firing angle (alphamin)
-        alpha_min = np.arcsin(min(1.0, self.Vdc/self.Vm))  # Clip to valid range
-        alpha_min = max(0, alpha_min)
+        alpha_min = minimum_firing_angle(self.Vm, self.Vdc)
         
         # Check if specified firing angle allows the circuit to operate
         if self.specified_alpha < alpha_min:
-            # Circuit doesn't operate - return zero values
+            # Circuit doesn't operate - return the shared flat results
             self.circuit_operates = False
             self.alpha = self.specified_alpha
             self.beta = self.alpha
             self.A = 0
-            self.conducting_angle = 0
-            self.conducting_time = 0
-            self.Iavg = 0
-            self.Irms = 0
-            self.Vavg = self.Vdc  # Output voltage remains at Vdc
-            self.Vrms = self.Vdc
-            self.power = 0
-            self.power_factor = 0
-            self.form_factor = 1  # Vrms/Vavg = 1 for DC
-            self.ripple_factor = 0
-            self.efficiency = 0
-            return self.generate_results()
+            self.is_continuous = False
+            return inoperative_results(self.Vm, self.Vdc, self.alpha)
         else:
             # Circuit operates normally
             self.circuit_operates = True
@@ -49,24 +44,15 @@ class ControlledFullWaveSolver(BaseRectifierSolver):
             
             # For full-wave, we need to check if current is continuous or discontinuous
             # Step 2: Find A by setting i(alpha) = 0
-            def equation_for_A(A):
-                # When wt = alpha, the exponential term (e^0) equals 1
-                return (self.Vm/self.Z) * np.sin(self.alpha - self.theta) - self.Vdc/self.R + A
-            
-            A_initial = [0.0]  # Initial guess
-            self.A = fsolve(equation_for_A, A_initial)[0]
+            # When wt = alpha, the exponential term (e^0) equals 1, so A simply
+            # cancels the forced response
+            # A purely resistive load (wTau = 0) has no transient term
+            self.A = self.Vdc_over_R - self.Vm_over_Z * np.sin(self.alpha - self.theta) if self.wTau > 0 else 0.0
             
-            # Step 3: Find beta by setting i(beta) = 0
-            def equation_for_beta(beta):
-                return (self.Vm/self.Z) * np.sin(beta - self.theta) - self.Vdc/self.R + self.A * np.exp(-(beta - self.alpha)/self.wTau)
-            
-            beta_initial = [np.pi + self.alpha]  # Initial guess (beyond π is possible)
-            try:
-                self.beta = fsolve(equation_for_beta, beta_initial)[0]
-                if self.beta < self.alpha:
-                    self.beta += np.pi  # Ensure beta > alpha
-            except Exception:
-                self.beta = np.pi  # Default if solver fails
+            # Step 3: Find beta as the first zero of i after alpha (beyond π is possible)
+            # The RLE formula is used directly: current_function switches to the
+            # Fourier series once a previous solve has set is_continuous
+            self.beta = find_extinction_angle(self._current_formula, self.alpha, self.alpha + 2*np.pi)
             
             # Check if current is continuous or discontinuous
             self.is_continuous = self.beta > (np.pi + self.alpha)
@@ -90,29 +76,47 @@ class ControlledFullWaveSolver(BaseRectifierSolver):
         """Calculate the current at angular position wt"""
         # If current is continuous, use the Fourier components to calculate current
         if hasattr(self, 'is_continuous') and self.is_continuous:
-            wt = np.array(wt)
-            i = np.full_like(wt, self.Iavg)  # DC component
-            
-            # Add AC components (harmonics)
-            n_harmonics = 10
-            harmonics = np.arange(2, 2*n_harmonics+1, 2)  # Even harmonics: 2,4,6...
-            
-            for n in harmonics:
-                # Voltage harmonic amplitude
-                Vn = 2 * self.Vm / np.pi * (1/(n-1) - 1/(n+1))
-                
-                # Impedance and phase at harmonic frequency
-                Zn = np.sqrt(self.R**2 + (n*self.w*self.L)**2)
-                theta_n = np.arctan(n*self.w*self.L/self.R)
-                
-                # Current harmonic
-                i += (Vn/Zn) * np.cos(n*wt + np.pi - theta_n)
-            
-            return i
+            return continuous_current(self, wt)
+        else:
+            return self._current_formula(wt)
+    
+    def current_derivative(self, wt):
+        """Calculate di/d(wt) at angular positions wt"""
+        if self.is_continuous:
+            return continuous_current_derivative(self, wt)
         else:
-            # Corrected discontinuous current equation:
-            # For controlled rectifier, the exponential term is e^((wt-alpha)/wTau)
-            return (self.Vm/self.Z) * np.sin(wt - self.theta) - self.Vdc/self.R + self.A * np.exp(-(wt - self.alpha)/self.wTau)
+            return self._current_derivative_formula(wt)
+    
+    def _current_formula(self, wt):
+        """Calculate the discontinuous-conduction current at angular positions wt"""
+        # Corrected discontinuous current equation:
+        # For controlled rectifier, the exponential term is e^((wt-alpha)/wTau)
+        # Evaluated in place to avoid one temporary per term
+        i = np.subtract(wt, self.theta)
+        np.sin(i, out=i)
+        i *= self.Vm_over_Z
+        i -= self.Vdc_over_R
+        # A purely resistive load (wTau = 0) has no transient term
+        if self.wTau > 0:
+            transient = np.subtract(wt, self.alpha)
+            transient *= -self.inv_wTau
+            np.exp(transient, out=transient)
+            transient *= self.A
+            i += transient
+        return i
+    
+    def _current_derivative_formula(self, wt):
+        """Calculate the discontinuous-conduction di/d(wt) at angular positions wt"""
+        di = np.subtract(wt, self.theta)
+        np.cos(di, out=di)
+        di *= self.Vm_over_Z
+        if self.wTau > 0:
+            transient = np.subtract(wt, self.alpha)
+            transient *= -self.inv_wTau
+            np.exp(transient, out=transient)
+            transient *= self.A * self.inv_wTau
+            di -= transient
+        return di
     
     def generate_waveforms(self):
         """Generate waveform data for visualization"""
@@ -1,5 +1,34 @@
+import warnings
+
 import numpy as np
-from .base_solver import BaseRectifierSolver
+
+from .base_solver import BaseRectifierSolver, minimum_firing_angle, inoperative_results, conduction_integrals
+
+def _refine_roots(f, fprime, lower, upper, args=()):
+    """Refine many bracketed sign changes of f at once with SciPy's array Newton.
+
+    Each root starts from the secant estimate of its bracket and uses the
+    analytic derivative. Newton itself is unbracketed, so the rare root that
+    fails to converge inside its bracket is redone with brentq. SciPy is
+    imported here rather than at module load, since only batch sweeps need it.
+    """
+    from scipy.optimize import brentq, newton
+    
+    f_lower = f(lower, *args)
+    f_upper = f(upper, *args)
+    x0 = lower + (upper - lower) * f_lower / (f_lower - f_upper)
+    with warnings.catch_warnings():
+        # Stray roots are caught below; SciPy's warnings about them are noise
+        warnings.simplefilter('ignore', RuntimeWarning)
+        try:
+            root, converged, _ = newton(f, x0, fprime=fprime, args=args, tol=1e-12, full_output=True)
+        except RuntimeError:  # Raised only when every root fails to converge
+            root, converged = x0, np.zeros(x0.shape, dtype=bool)
+    
+    stray = ~converged | (root < lower) | (root > upper)
+    for j in np.flatnonzero(stray):
+        root[j] = brentq(f, lower[j], upper[j], args=tuple(arg[j] for arg in args), xtol=1e-12)
+    return root
 
 class ControlledHalfWaveSolver(BaseRectifierSolver):
     """Solver for controlled half-wave rectifier with RLE load"""
@@ -13,28 +42,16 @@ class ControlledHalfWaveSolver(BaseRectifierSolver):
     def solve(self):
         """Implement the solution for controlled half-wave rectifier"""
         # Calculate the minimum possible firing angle (alphamin)
-        alpha_min = np.arcsin(min(1.0, self.Vdc/self.Vm))  # Clip to valid range
-        alpha_min = max(0, alpha_min)
+        alpha_min = minimum_firing_angle(self.Vm, self.Vdc)
         
         # Check if specified firing angle allows the circuit to operate
         if self.specified_alpha < alpha_min:
-            # Circuit doesn't operate - return zero values
+            # Circuit doesn't operate - return the shared flat results
             self.circuit_operates = False
             self.alpha = self.specified_alpha
             self.beta = self.alpha
             self.A = 0
-            self.conducting_angle = 0
-            self.conducting_time = 0
-            self.Iavg = 0
-            self.Irms = 0
-            self.Vavg = self.Vdc  # Output voltage remains at Vdc
-            self.Vrms = self.Vdc
-            self.power = 0
-            self.power_factor = 0
-            self.form_factor = 1  # Vrms/Vavg = 1 for DC
-            self.ripple_factor = 0
-            self.efficiency = 0
-            return self.generate_results()
+            return inoperative_results(self.Vm, self.Vdc, self.alpha)
         else:
             # Circuit operates normally
             self.circuit_operates = True
@@ -42,28 +59,106 @@ class ControlledHalfWaveSolver(BaseRectifierSolver):
             # Use the common solver logic for the rest of the calculation
             return self.solve_rectifier()
     
-    def generate_waveforms(self):
-        """Generate waveform data for visualization
-           Override the base method to handle non-operating circuit case"""
-        if not self.circuit_operates:
-            # Circuit doesn't operate, all values flat except source voltage
-            wt = np.linspace(0, 2*np.pi, 1000)
-            vs = self.Vm * np.sin(wt)
-            vo = np.full_like(wt, self.Vdc)
-            vd = vs - vo
-            i_out = np.zeros_like(wt)
-            vl = np.zeros_like(wt)
-            vr = np.zeros_like(wt)
-            
-            return {
-                'time': wt.tolist(),
-                'vs': vs.tolist(),
-                'vo': vo.tolist(),
-                'vd': vd.tolist(),
-                'i_out': i_out.tolist(),
-                'vl': vl.tolist(),
-                'vr': vr.tolist()
-            }
+    def solve_batch(self, firing_angles, num_points=256):
+        """Solve the circuit for a whole sweep of firing angles at once.
+
+        Every step of solve_rectifier is evaluated on arrays instead of once per
+        angle: beta is bracketed on a coarse grid after each alpha and all the
+        brackets are refined together by SciPy's array Newton solver. Angles
+        below alpha_min give the flat inoperative values.
+        Returns a dictionary of arrays (one entry per firing angle) with the
+        parameters and performance metrics; no waveforms are generated.
+        """
+        alpha = np.asarray(firing_angles, dtype=float)
+        operates = alpha >= minimum_firing_angle(self.Vm, self.Vdc)
+        
+        # i(alpha) = 0 fixes the transient: i = forced(wt) - forced(alpha)*exp(-(wt - alpha)/wTau),
+        # so A (its value at alpha, as in solve_rectifier) is -forced(alpha)
+        forced_current = self.Vm_over_Z * np.sin(alpha - self.theta) - self.Vdc_over_R
+        if self.wTau > 0:
+            A = -forced_current
+            decay_rate = self.inv_wTau
         else:
-            # Circuit operates normally, use the base implementation
-            return super().generate_waveforms()
\ No newline at end of file
+            A = np.zeros_like(alpha)
+            decay_rate = 0.0
+            forced_current = np.zeros_like(alpha)
+        
+        def current(wt, alpha, forced_current):
+            return (self.Vm_over_Z * np.sin(wt - self.theta) - self.Vdc_over_R
+                    - forced_current * np.exp(-(wt - alpha) * decay_rate))
+        
+        def current_derivative(wt, alpha, forced_current):
+            return (self.Vm_over_Z * np.cos(wt - self.theta)
+                    + forced_current * decay_rate * np.exp(-(wt - alpha) * decay_rate))
+        
+        # Bracket the first zero after each alpha on a coarse grid
+        step = 2*np.pi / num_points
+        wt = alpha[..., None] + step * np.arange(1, num_points + 1)
+        not_conducting = current(wt, alpha[..., None], forced_current[..., None]) <= 0
+        crosses = not_conducting.any(axis=-1)
+        k = not_conducting.argmax(axis=-1)
+        
+        # A crossing within the first step is bracketed from just past alpha
+        # (where the current is zero by construction); no current there at all
+        # means the thyristor never conducts.
+        lower = np.where(k > 0, alpha + k*step, alpha + 1e-9*2*np.pi)
+        i_lower = current(lower, alpha, forced_current)
+        never_on = crosses & (k == 0) & (i_lower <= 0)
+        crosses &= ~never_on
+        
+        # Conduction that never stops within a period ends at alpha + 2π
+        beta = np.where(never_on, alpha, alpha + 2*np.pi)
+        
+        # Refine every bracket at once with a vectorised Newton solve
+        if crosses.any():
+            upper = alpha + (k + 1)*step
+            args = (alpha[crosses], forced_current[crosses])
+            beta[crosses] = _refine_roots(current, current_derivative, lower[crosses], upper[crosses], args)
+        
+        # A thyristor fired before alpha_min never turns on
+        beta = np.where(operates, beta, alpha)
+        A = np.where(operates, A, 0)
+        conducting_angle = beta - alpha
+        
+        # Average and RMS quantities, as in solve_rectifier
+        current_int, current_sq_int = conduction_integrals(
+            self.Vm_over_Z, self.Vdc_over_R, self.wTau, self.theta, alpha, beta)
+        Iavg = current_int / (2*np.pi)
+        Irms = np.sqrt(np.maximum(current_sq_int, 0) / (2*np.pi))
+        
+        dc_span = 2*np.pi - conducting_angle
+        sin_integral = np.cos(alpha) - np.cos(beta)
+        sin_sq_integral = conducting_angle/2 - (np.sin(2*beta) - np.sin(2*alpha))/4
+        Vavg = (self.Vdc * dc_span + self.Vm * sin_integral) / (2*np.pi)
+        Vrms = np.sqrt((self.Vdc**2 * dc_span + self.Vm**2 * sin_sq_integral) / (2*np.pi))
+        
+        # Performance metrics, guarded against division by zero element-wise
+        power = self.Vdc * Iavg + Irms**2 * self.R
+        Pdc = Vavg * Iavg
+        Prms = Vrms * Irms
+        with np.errstate(divide='ignore', invalid='ignore'):
+            power_factor = np.where(Irms > 0, power / (self.Vs_rms * Irms), 0)
+            form_factor = np.where(Vavg > 0, Vrms / Vavg, 0)
+            ripple_factor = np.where(Vavg > 0, np.sqrt(np.maximum(form_factor**2 - 1, 0)), 0)
+            efficiency = np.where(Prms > 0, Pdc / Prms, 0)
+        
+        return {
+            'parameters': {
+                'alpha': alpha,
+                'beta': beta,
+                'A': A,
+                'conducting_angle': conducting_angle,
+                'conducting_time': 1000 * conducting_angle / self.w
+            },
+            'performance': {
+                'Iavg': Iavg,
+                'Irms': Irms,
+                'Vavg': Vavg,
+                'Vrms': Vrms,
+                'power_factor': power_factor,
+                'form_factor': form_factor,
+                'ripple_factor': ripple_factor,
+                'efficiency': efficiency,
+                'power': power
+            }
+        }
@@ -1,6 +1,14 @@
+import math
+
 import numpy as np
-from scipy.optimize import fsolve
-from .base_solver import BaseRectifierSolver
+from .base_solver import BaseRectifierSolver, WAVEFORM_POINTS, WAVEFORM_WT, WAVEFORM_SIN_WT
+
+# The main diode conducts on the first half of the shared waveform grid and
+# the freewheeling diode on the second; π is a grid point, so both halves
+# are contiguous slices
+_HALF = np.searchsorted(WAVEFORM_WT, np.pi)
+_FIRST_HALF = slice(None, _HALF)
+_SECOND_HALF = slice(_HALF, None)
 
 class FreewheelingHalfWaveSolver(BaseRectifierSolver):
     """Solver for uncontrolled half-wave rectifier with RL load and freewheeling diode"""
@@ -25,20 +33,17 @@ class FreewheelingHalfWaveSolver(BaseRectifierSolver):
         self.conducting_angle = self.beta - self.alpha  # Should be π
         self.conducting_time = 1000 * self.conducting_angle / self.w  # ms
         
-        # Calculate currents and voltages using waveforms
-        waveforms = self.generate_waveforms()
-        wt_values = np.array(waveforms['time'])
-        current_values = np.array(waveforms['i_out'])
-        voltage_values = np.array(waveforms['vo'])
+        # Calculate performance metrics from the exact integrals over one period
+        current_int, current_sq_int = self.conduction_integrals()
+        self.Iavg = current_int / (2*np.pi)
+        self.Irms = math.sqrt(max(current_sq_int, 0) / (2*np.pi))
         
-        # Calculate performance metrics
-        self.Iavg = np.mean(current_values)
-        self.Irms = np.sqrt(np.mean(current_values**2))
-        self.Vavg = np.mean(voltage_values)
-        self.Vrms = np.sqrt(np.mean(voltage_values**2))
+        # vo follows the source for 0..π and is clamped to 0 by the FWD after
+        self.Vavg = self.Vm / np.pi
+        self.Vrms = self.Vm / 2
         
         # Source RMS values
-        Vs_rms = self.Vm / np.sqrt(2)
+        Vs_rms = self.Vs_rms
         
         # Calculate power on load: I²R
         self.power = self.Irms**2 * self.R
@@ -59,103 +64,142 @@ class FreewheelingHalfWaveSolver(BaseRectifierSolver):
         return self.generate_results()
     
     def _solve_constants(self):
-        """Solve for constants A and B using boundary conditions"""
-        def equations(vars):
-            A, B = vars
-            
-            # Current from positive half equation (main diode conducting) at t=0
-            i_0_pos = (self.Vm/self.Z) * np.sin(-self.theta) + A
-            
-            # Current from negative half equation (freewheeling diode) at t=2π
-            i_2pi_neg = B * np.exp(-(2*np.pi - np.pi)/self.wTau)
-            
-            # For steady state: i(0) from positive half = i(2π) from negative half
-            eq1 = i_0_pos - i_2pi_neg
-            
-            # Current from positive half equation at t=π
-            i_pi_pos = (self.Vm/self.Z) * np.sin(np.pi - self.theta) + A * np.exp(-np.pi/self.wTau)
+        """Solve for constants A and B using boundary conditions
+        
+        Both conditions are linear in A and B:
+          i(0) = i(2π):  -(Vm/Z)sin(theta) + A = B*e
+          i(π-) = i(π+):  (Vm/Z)sin(theta) + A*e = B
+        with e = exp(-π/wTau), so the steady state follows in closed form:
+          A = B = (Vm/Z)sin(theta) / (1 - e)
+        """
+        # A purely resistive load (wTau = 0) has theta = 0 and no transient
+        e = math.exp(-np.pi * self.inv_wTau)
+        A = B = self.Vm_over_Z * math.sin(self.theta) / (1 - e)
+        
+        self.A = A
+        self.constant_B = B
+    
+    def conduction_integrals(self):
+        """Return the integrals of i and i² over a full period - overridden for FWD circuit
+
+        The load current never stops: it is (Vm/Z)sin(wt - theta) + A*exp(-wt/wTau)
+        through the main diode on 0..π and B*exp(-(wt - π)/wTau) through the
+        freewheeling diode on π..2π, so both integrals have closed forms.
+        """
+        a, tau = self.Vm_over_Z, self.wTau
+        s0, c0 = math.sin(-self.theta), math.cos(-self.theta)
+        s1, c1 = math.sin(np.pi - self.theta), math.cos(np.pi - self.theta)
+        
+        # Steady-state terms of the first half: ∫sin, ∫sin²
+        current_int = a * (c0 - c1)
+        current_sq_int = a*a * (np.pi/2 - (s1*c1 - s0*c0)/2)
+        
+        if tau > 0:
+            decay = math.exp(-np.pi/tau)
+            # ∫exp, ∫exp² over either half and ∫sin·exp over the first half
+            exp_int = tau * (1 - decay)
+            exp_sq_int = tau/2 * (1 - decay*decay)
+            sin_exp_int = tau * ((s0 + tau*c0) - (s1 + tau*c1)*decay) / (1 + tau*tau)
             
-            # Current from negative half equation at t=π
-            i_pi_neg = B
+            A, B = self.A, self.constant_B
+            current_int += (A + B) * exp_int
+            current_sq_int += (A*A + B*B) * exp_sq_int + 2*a*A*sin_exp_int
+        
+        return current_int, current_sq_int
+    
+    def transient_current(self, wt):
+        """Calculate the decaying terms of the current at wt (an array) - overridden for FWD circuit"""
+        wt = np.asarray(wt, dtype=float)
+        transient = np.zeros_like(wt)
+        
+        # A purely resistive load (wTau = 0) has no transient term
+        if self.wTau > 0:
+            first_half = wt < np.pi
+            second_half = ~first_half
             
-            # For continuity at π: i(π-) = i(π+)
-            eq2 = i_pi_pos - i_pi_neg
+            # First half: A*exp(-wt/wTau) on top of the steady-state current
+            transient[first_half] = self.A * np.exp(-wt[first_half] * self.inv_wTau)
             
-            return [eq1, eq2]
-        
-        # Initial guess for A and B
-        initial_guess = [0.1, 0.1]
-        A, B = fsolve(equations, initial_guess)
+            # Second half: the freewheeling current is nothing but its decay
+            transient[second_half] = self.constant_B * np.exp(-(wt[second_half] - np.pi) * self.inv_wTau)
+        return transient
+    
+    def current_function(self, wt, transient=None):
+        """Calculate the current at angular positions wt (an array) - overridden for FWD circuit"""
+        wt = np.asarray(wt, dtype=float)
+        i = self.transient_current(wt) if transient is None else transient.copy()
         
-        self.A = A
-        self.constant_B = B
+        # First half: Main diode conducting adds the steady-state current
+        first_half = wt < np.pi
+        i[first_half] += self.Vm_over_Z * np.sin(wt[first_half] - self.theta)
+        return i
     
-    def current_function(self, wt):
-        """Calculate the current at angular position wt - overridden for FWD circuit"""
-        if wt < np.pi:
-            # First half: Main diode conducting
-            return (self.Vm/self.Z) * np.sin(wt - self.theta) + self.A * np.exp(-wt/self.wTau)
-        else:
-            # Second half: Freewheeling diode conducting
-            return self.constant_B * np.exp(-(wt - np.pi)/self.wTau)
+    def current_derivative(self, wt, transient=None):
+        """Calculate di/d(wt) at angular positions wt (an array) - overridden for FWD circuit"""
+        wt = np.asarray(wt, dtype=float)
+        if transient is None:
+            transient = self.transient_current(wt)
+        
+        # Both transient terms decay at the same rate
+        di = transient * -self.inv_wTau if self.wTau > 0 else np.zeros_like(wt)
+        
+        # First half: Main diode conducting
+        first_half = wt < np.pi
+        di[first_half] += self.Vm_over_Z * np.cos(wt[first_half] - self.theta)
+        return di
     
     def generate_waveforms(self):
         """Generate waveform data for FWD circuit visualization"""
-        wt = np.linspace(0, 2*np.pi, 1000)  # Angular position from 0 to 2π
+        # One contiguous zeroed buffer holds every trace; each row is a view into it
+        waveforms = np.zeros((10, WAVEFORM_POINTS))
+        wt, vs, vo, vd_main, vd_fw, i_out, i_source, i_fw, vl, vr = waveforms
+        wt[:] = WAVEFORM_WT  # Angular position from 0 to 2π
         
         # Source voltage
-        vs = self.Vm * np.sin(wt)
+        np.multiply(WAVEFORM_SIN_WT, self.Vm, out=vs)
         
         # Output voltage
-        vo = np.zeros_like(wt)
-        first_half = wt < np.pi
-        vo[first_half] = vs[first_half]  # Vsource during first half
+        vo[_FIRST_HALF] = vs[_FIRST_HALF]  # Vsource during first half
         # Second half remains zero (FWD keeps Vo at 0V)
         
-        # Diode voltages
-        vd_main = np.zeros_like(wt)
-        vd_fw = np.zeros_like(wt)
-        
         # Main diode voltage (zero during conduction in first half, vs in second half)
-        vd_main[first_half] = 0  # Conducting in first half
-        vd_main[~first_half] = vs[~first_half]  # Blocking in second half
+        vd_main[_SECOND_HALF] = vs[_SECOND_HALF]  # Blocking in second half
         
         # Freewheeling diode voltage correction:
         # During positive half (0 to π): FWD is reverse biased, so vd_fw = +vs (not -vs)
         # During negative half (π to 2π): FWD is conducting, so vd_fw = 0
-        vd_fw[first_half] = vs[first_half]  # Blocking with +vs voltage in first half
-        vd_fw[~first_half] = 0  # Conducting in second half
+        vd_fw[_FIRST_HALF] = vs[_FIRST_HALF]  # Blocking with +vs voltage in first half
         
-        # Current calculation
-        i_out = np.zeros_like(wt)
-        for i, t in enumerate(wt):
-            i_out[i] = self.current_function(t)
+        # Current calculation, sharing the transient exponentials with vL below
+        transient = self.transient_current(wt)
+        i_out[:] = self.current_function(wt, transient)
         
         # Source current (only flows during first half)
-        i_source = np.zeros_like(wt)
-        i_source[first_half] = i_out[first_half]
+        i_source[_FIRST_HALF] = i_out[_FIRST_HALF]
         
         # Freewheeling current (only flows during second half)
-        i_fw = np.zeros_like(wt)
-        i_fw[~first_half] = i_out[~first_half]
+        i_fw[_SECOND_HALF] = i_out[_SECOND_HALF]
         
         # Inductor voltage (L * di/dt)
-        vl = np.zeros_like(wt)
-        di_dt = np.gradient(i_out, wt)
-        vl = self.L * di_dt * self.w
+        # di/d(wt) is converted to di/dt by multiplying by angular frequency
+        np.multiply(self.current_derivative(wt, transient), self.L * self.w, out=vl)
         
         # Resistor voltage (I*R)
-        vr = i_out * self.R
+        np.multiply(i_out, self.R, out=vr)
+        
+        # Plots do not need double precision: float32 halves the payload.
+        # The arrays are serialised directly by the app's JSON provider.
+        wt, vs, vo, vd_main, vd_fw, i_out, i_source, i_fw, vl, vr = waveforms.astype(np.float32)
         
         return {
-            'time': wt.tolist(),
-            'vs': vs.tolist(),
-            'vo': vo.tolist(),
-            'vd': vd_main.tolist(),
-            'vd_fw': vd_fw.tolist(),  # Corrected freewheeling diode voltage
-            'i_out': i_out.tolist(),
-            'i_source': i_source.tolist(),
-            'i_fw': i_fw.tolist(),
-            'vl': vl.tolist(),
-            'vr': vr.tolist()
-        }
\ No newline at end of file
+            'time': wt,
+            'vs': vs,
+            'vo': vo,
+            'vd': vd_main,
+            'vd_fw': vd_fw,  # Corrected freewheeling diode voltage
+            'i_out': i_out,
+            'i_source': i_source,
+            'i_fw': i_fw,
+            'vl': vl,
+            'vr': vr
+        }
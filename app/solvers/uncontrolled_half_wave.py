@@ -1,5 +1,4 @@
-import numpy as np
-from .base_solver import BaseRectifierSolver
+from .base_solver import BaseRectifierSolver, minimum_firing_angle
 
 class UncontrolledHalfWaveSolver(BaseRectifierSolver):
     """Solver for uncontrolled half-wave rectifier with RLE load"""
@@ -7,8 +6,7 @@ class UncontrolledHalfWaveSolver(BaseRectifierSolver):
     def solve(self):
         """Implement the solution for uncontrolled half-wave rectifier"""
         # Step 1: Calculate alpha (firing angle) based on circuit parameters
-        alpha_initial = np.arcsin(min(1.0, self.Vdc/self.Vm))  # Clip to valid range
-        self.alpha = max(0, alpha_initial)
+        self.alpha = minimum_firing_angle(self.Vm, self.Vdc)
         
         # Use the common solver logic for the rest of the calculation
         return self.solve_rectifier()
\ No newline at end of file
@@ -67,7 +67,7 @@ export function getFormulaContent(formulaType) {
                     <div class="mb-3">
                         <h6>Formula:</h6>
                         <div class="formula-scroll"><p>Found by solving the equation: $$i(\\beta) = 0$$</p></div>
-                        <div class="formula-scroll"><p>Where: $$i(\\omega t) = \\frac{V_m}{Z}\\sin(\\omega t - \\theta) - \\frac{V_{dc}}{R} + Ae^{-\\frac{\\omega t}{\\omega\\tau}}$$</p></div>
+                        <div class="formula-scroll"><p>Where: $$i(\\omega t) = \\frac{V_m}{Z}\\sin(\\omega t - \\theta) - \\frac{V_{dc}}{R} + Ae^{-\\frac{\\omega t - \\alpha}{\\omega\\tau}}$$</p></div>
                     </div>
                     
                     <div class="mb-3">
@@ -185,7 +185,7 @@ export function getFormulaContent(formulaType) {
                     <div class="mb-3">
                         <h6>Formula:</h6>
                         <div class="formula-scroll"><p>$$I_{avg} = \\frac{1}{2\\pi} \\int_{\\alpha}^{\\beta} i(\\omega t) \\, d(\\omega t)$$</p></div>
-                        <div class="formula-scroll"><p>Where: $$i(\\omega t) = \\frac{V_m}{Z}\\sin(\\omega t - \\theta) - \\frac{V_{dc}}{R} + Ae^{-\\frac{\\omega t}{\\omega\\tau}}$$</p></div>
+                        <div class="formula-scroll"><p>Where: $$i(\\omega t) = \\frac{V_m}{Z}\\sin(\\omega t - \\theta) - \\frac{V_{dc}}{R} + Ae^{-\\frac{\\omega t - \\alpha}{\\omega\\tau}}$$</p></div>
                     </div>
                     
                     <div class="mb-3">
@@ -208,7 +208,7 @@ export function getFormulaContent(formulaType) {
                     <div class="mb-3">
                         <h6>Formula:</h6>
                         <div class="formula-scroll"><p>$$I_{rms} = \\sqrt{\\frac{1}{2\\pi} \\int_{\\alpha}^{\\beta} [i(\\omega t)]^2 \\, d(\\omega t)}$$</p></div>
-                        <div class="formula-scroll"><p>Where: $$i(\\omega t) = \\frac{V_m}{Z}\\sin(\\omega t - \\theta) - \\frac{V_{dc}}{R} + Ae^{-\\frac{\\omega t}{\\omega\\tau}}$$</p></div>
+                        <div class="formula-scroll"><p>Where: $$i(\\omega t) = \\frac{V_m}{Z}\\sin(\\omega t - \\theta) - \\frac{V_{dc}}{R} + Ae^{-\\frac{\\omega t - \\alpha}{\\omega\\tau}}$$</p></div>
                     </div>
                     
                     <div class="mb-3">
@@ -1,16 +1,36 @@
 import os
-from flask import Flask, render_template, request, jsonify, send_from_directory
+from functools import lru_cache
 
-# Internal services
-from app.services.nlp_service import process_query as _process_nlp_query
-from app.services.solver_factory import create_solver
+import orjson
+from flask import Flask, Response, render_template, request, jsonify
+from flask.json.provider import JSONProvider
+
+# Internal services (the Gemini-backed NLP service is imported lazily by its
+# route: google-generativeai is slow to import and only that endpoint needs it)
+from app.services.solver_factory import solve_circuit
 
 # ---------------------------------------------------------------------------
 # Flask application setup
 # ---------------------------------------------------------------------------
+class OrjsonProvider(JSONProvider):
+    """JSON provider backed by orjson.
+
+    Solver results carry their waveforms as NumPy arrays; orjson writes those
+    straight from the array buffer instead of going through Python lists.
+    Request bodies (``request.get_json()``) are parsed with orjson as well.
+    """
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
 app = Flask(
     __name__, template_folder="app/templates", static_folder="app/static"
 )
+app.json = OrjsonProvider(app)
 
 
 @app.after_request
@@ -25,19 +45,34 @@ def add_header(response):
 # Routes
 # ---------------------------------------------------------------------------
 
+@lru_cache(maxsize=None)
+def _rendered_index():
+    return render_template("index.html")
+
+
+@lru_cache(maxsize=None)
+def _static_file(filename):
+    with open(os.path.join(app.static_folder, filename), "rb") as fh:
+        return fh.read()
+
+
 @app.route("/")
 def index():
-    return render_template("index.html")
+    # The page takes no per-request context, so it is rendered once and
+    # reused (templates keep reloading on every request in debug mode).
+    if app.debug:
+        return render_template("index.html")
+    return _rendered_index()
 
 
 @app.route("/robots.txt")
 def robots_txt():
-    return send_from_directory(app.static_folder, "robots.txt", mimetype="text/plain")
+    return Response(_static_file("robots.txt"), mimetype="text/plain")
 
 
 @app.route("/sitemap.xml")
 def sitemap_xml():
-    return send_from_directory(app.static_folder, "sitemap.xml", mimetype="application/xml")
+    return Response(_static_file("sitemap.xml"), mimetype="application/xml")
 
 
 @app.route("/api/solve-with-nlp", methods=["POST"])
@@ -47,6 +82,8 @@ def api_solve_with_nlp():
     user_query = data.get("query", "")
 
     try:
+        from app.services.nlp_service import process_query as _process_nlp_query
+
         result = _process_nlp_query(user_query)
         return jsonify(result)
     except EnvironmentError as exc:
@@ -74,7 +111,7 @@ def solve():
     Vdc = float(data.get("Vdc", 0))
     firing_angle = float(data.get("firing_angle", 0))
 
-    solver = create_solver(
+    results = solve_circuit(
         wave_type=wave_type,
         control_type=control_type,
         is_fwd=(circuit_type == "fwd"),
@@ -86,10 +123,10 @@ def solve():
         firing_angle=firing_angle,
     )
 
-    if not solver:
+    if results is None:
         return jsonify({"error": "Circuit type not implemented yet."}), 400
 
-    return jsonify(solver.solve())
+    return jsonify(results)
 
 
 # ---------------------------------------------------------------------------
@@ -0,0 +1,108 @@
+"""Tests for the NLP service, with the Gemini model replaced by a stub."""
+import json
+import os
+from types import SimpleNamespace
+
+import pytest
+
+os.environ.setdefault("GEMINI_API_KEY", "test")
+
+from app.services import nlp_service  # noqa: E402
+
+
+class StubModel:
+    """Records the prompts it is given and answers with a fixed reply."""
+
+    def __init__(self, reply):
+        self.reply = reply
+        self.calls = []
+
+    def generate_content(self, contents):
+        self.calls.append(contents)
+        return SimpleNamespace(text=self.reply)
+
+
+@pytest.fixture
+def stub_model(monkeypatch):
+    def install(reply):
+        model = StubModel(reply if isinstance(reply, str) else json.dumps(reply))
+        monkeypatch.setattr(nlp_service, "_MODEL", model)
+        return model
+
+    nlp_service._extract_params.cache_clear()
+    yield install
+    nlp_service._extract_params.cache_clear()
+
+
+def test_schema_covers_every_field_process_query_reads():
+    properties = nlp_service.RESPONSE_SCHEMA["properties"]
+
+    assert nlp_service.RESPONSE_SCHEMA["required"] == ["supported"]
+    for field in ("supported", "reason", "rectifier_type", "control_type", "freewheeling_diode",
+                  "R_load", "L_load", "E_load", "source_voltage_vrms", "source_frequency_hz",
+                  "firing_angle_alpha"):
+        assert field in properties
+    assert properties["rectifier_type"]["enum"] == ["half_wave", "full_wave"]
+    assert properties["control_type"]["enum"] == ["controlled", "uncontrolled"]
+
+
+@pytest.mark.parametrize("query", ["", "   \n\t"])
+def test_blank_query_skips_the_model(stub_model, query):
+    model = stub_model({"supported": False})
+
+    assert nlp_service.process_query(query) == {"supported": False, "reason": "Empty query provided."}
+    assert model.calls == []
+
+
+def test_spelled_out_values_reach_the_model(stub_model):
+    model = stub_model({
+        "supported": True,
+        "rectifier_type": "half_wave",
+        "control_type": "uncontrolled",
+        "freewheeling_diode": False,
+        "R_load": 10,
+        "L_load": 0,
+        "E_load": 0,
+        "source_voltage_vrms": 100,
+        "source_frequency_hz": 50,
+        "firing_angle_alpha": None,
+    })
+
+    result = nlp_service.process_query("a hundred volts rms, fifty hertz, ten ohms, half-wave")
+
+    assert len(model.calls) == 1
+    assert result["supported"] is True
+    assert result["results"]["parameters"]["beta"] == pytest.approx(3.141593, abs=1e-6)
+
+
+def test_unsupported_reply_is_passed_through(stub_model):
+    reply = {"supported": False, "reason": "Three-phase rectifiers are not supported."}
+    stub_model(reply)
+
+    assert nlp_service.process_query("three-phase bridge, 400 V") == reply
+
+
+def test_missing_values_are_reported(stub_model):
+    stub_model({
+        "supported": True,
+        "rectifier_type": "full_wave",
+        "control_type": "controlled",
+        "freewheeling_diode": False,
+        "R_load": 10,
+        "L_load": 0.1,
+        "E_load": 0,
+        "source_voltage_vrms": 120,
+        "source_frequency_hz": 60,
+        "firing_angle_alpha": None,
+    })
+
+    result = nlp_service.process_query("controlled full wave, 120 V, 60 Hz, 10 ohm, 100 mH")
+
+    assert result["supported"] is False
+    assert "firing_angle_alpha" in result["reason"]
+
+
+def test_unparseable_reply(stub_model):
+    stub_model("not json")
+
+    assert nlp_service.process_query("half wave, 100 V")["supported"] is False
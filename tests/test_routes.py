@@ -0,0 +1,68 @@
+"""Tests for the /solve route's JSON contract."""
+import numpy as np
+import pytest
+
+from app.services.solver_factory import solve_circuit
+from app.solvers.base_solver import WAVEFORM_POINTS
+from main import app
+
+HALF_WAVE_TRACES = {"time", "vs", "vo", "vd", "i_out", "vl", "vr"}
+FREEWHEELING_TRACES = {"time", "vs", "vo", "vd", "vd_fw", "i_out", "i_source", "i_fw", "vl", "vr"}
+FULL_WAVE_TRACES = {"time", "vs", "vo", "i_out", "id1", "id2", "id3", "id4",
+                    "vd1", "vd2", "vd3", "vd4", "vl", "vr"}
+
+
+@pytest.fixture
+def client():
+    return app.test_client()
+
+
+def post_solve(client, **overrides):
+    body = {"circuit_type": "rle", "control_type": "uncontrolled", "wave_type": "half",
+            "Vm": 170, "f": 60, "R": 10, "L": 0.05, "Vdc": 20, "firing_angle": 0.5}
+    body.update(overrides)
+    return client.post("/solve", json=body)
+
+
+@pytest.mark.parametrize("overrides, traces", [
+    ({}, HALF_WAVE_TRACES),
+    ({"control_type": "controlled"}, HALF_WAVE_TRACES),
+    ({"control_type": "controlled", "firing_angle": 0.01}, HALF_WAVE_TRACES),  # fired before alpha_min
+    ({"circuit_type": "fwd"}, FREEWHEELING_TRACES),
+    ({"wave_type": "full"}, FULL_WAVE_TRACES),
+    ({"wave_type": "full", "control_type": "controlled"}, FULL_WAVE_TRACES),
+])
+def test_solve_returns_the_result_contract(client, overrides, traces):
+    response = post_solve(client, **overrides)
+
+    assert response.status_code == 200
+    assert response.mimetype == "application/json"
+    data = response.get_json()
+    assert set(data) == {"parameters", "performance", "waveforms"}
+    assert {"alpha", "beta", "A", "conducting_angle", "conducting_time"} <= set(data["parameters"])
+    assert {"Iavg", "Irms", "Vavg", "Vrms", "power_factor", "form_factor",
+            "ripple_factor", "efficiency", "power"} <= set(data["performance"])
+    for value in (*data["parameters"].values(), *data["performance"].values()):
+        assert isinstance(value, (int, float))
+
+    assert set(data["waveforms"]) == traces
+    for name, trace in data["waveforms"].items():
+        assert isinstance(trace, list) and len(trace) == WAVEFORM_POINTS, name
+
+
+def test_solve_sends_the_float32_waveforms_losslessly(client):
+    data = post_solve(client).get_json()
+    expected = solve_circuit(wave_type="half", control_type="uncontrolled", is_fwd=False,
+                             Vm=170.0, f=60.0, R=10.0, L=0.05, Vdc=20.0, firing_angle=0.5)
+
+    for name, trace in expected["waveforms"].items():
+        assert trace.dtype == np.float32, name
+        # Each JSON number reads back as exactly the float32 it was written from
+        np.testing.assert_array_equal(np.array(data["waveforms"][name], dtype=np.float32), trace, err_msg=name)
+
+
+def test_solve_rejects_unknown_circuits(client):
+    response = post_solve(client, wave_type="three_phase")
+
+    assert response.status_code == 400
+    assert "error" in response.get_json()
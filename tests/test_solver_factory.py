@@ -0,0 +1,44 @@
+"""Tests for the memoised solver entry point."""
+import numpy as np
+import pytest
+
+from app.services.solver_factory import solve_circuit
+
+PARAMS = dict(wave_type="full", control_type="uncontrolled", is_fwd=False,
+              Vm=200.0, f=60.0, R=2.0, L=0.2, Vdc=0.0, firing_angle=0.0)
+
+
+def test_cached_results_cannot_be_changed_by_a_caller():
+    results = solve_circuit(**PARAMS)
+    beta = results["parameters"]["beta"]
+
+    results["parameters"]["beta"] = -1
+    results["performance"].clear()
+    results["waveforms"]["i_out"] = None
+    with pytest.raises(ValueError):
+        solve_circuit(**PARAMS)["waveforms"]["vs"][0] = 0
+
+    again = solve_circuit(**PARAMS)
+    assert again["parameters"]["beta"] == beta
+    assert "Iavg" in again["performance"]
+    assert isinstance(again["waveforms"]["i_out"], np.ndarray)
+
+
+def test_repeated_parameters_share_the_cached_arrays():
+    first = solve_circuit(**PARAMS)
+    second = solve_circuit(**PARAMS)
+
+    assert first is not second
+    assert first["waveforms"]["i_out"] is second["waveforms"]["i_out"]
+
+
+def test_uncontrolled_continuous_diode_currents_follow_the_source_polarity():
+    waveforms = solve_circuit(**PARAMS)["waveforms"]
+    vs, i_out = waveforms["vs"], waveforms["i_out"]
+
+    assert np.all(i_out > 0)  # continuous conduction
+    # D1/D4 carry the load current while vs > 0, D2/D3 while vs < 0
+    np.testing.assert_array_equal(waveforms["id1"], np.where(vs > 0, i_out, 0))
+    np.testing.assert_array_equal(waveforms["id4"], waveforms["id1"])
+    np.testing.assert_array_equal(waveforms["id2"], np.where(vs < 0, i_out, 0))
+    np.testing.assert_array_equal(waveforms["id3"], waveforms["id2"])
@@ -0,0 +1,225 @@
+"""Regression tests for the rectifier solvers against known-good values.
+
+The reference extinction angles and averages were checked against a direct
+numerical integration of the load equation L di/dt = vs - Vdc - R i.
+"""
+import math
+
+import numpy as np
+import pytest
+from scipy.integrate import quad
+
+from app.solvers import (
+    UncontrolledHalfWaveSolver,
+    ControlledHalfWaveSolver,
+    FreewheelingHalfWaveSolver,
+    UncontrolledFullWaveSolver,
+    ControlledFullWaveSolver,
+)
+
+
+def assert_finite_results(results):
+    """Every reported number and waveform sample must be finite."""
+    for group in ("parameters", "performance"):
+        for name, value in results[group].items():
+            assert math.isfinite(value), f"{group}.{name} = {value}"
+    for name, trace in results["waveforms"].items():
+        assert np.all(np.isfinite(trace)), f"waveforms.{name} is not finite"
+
+
+# ---------------------------------------------------------------------------
+# Short time constants: alpha/wTau far beyond exp()'s range (~709)
+# ---------------------------------------------------------------------------
+
+def test_half_wave_small_inductance_does_not_overflow():
+    results = UncontrolledHalfWaveSolver("rle", 100, 50, 100, 1e-4, 50).solve()
+
+    assert_finite_results(results)
+    assert results["parameters"]["beta"] == pytest.approx(2.6183080, abs=1e-6)
+    assert results["performance"]["Iavg"] == pytest.approx(0.1089978, rel=1e-5)
+
+
+def test_controlled_half_wave_small_inductance_does_not_overflow():
+    results = ControlledHalfWaveSolver("rle", 100, 50, 100, 1e-4, 0, 1.0).solve()
+
+    assert_finite_results(results)
+    # Practically resistive: Iavg -> Vm/(2*pi*R) * (1 + cos(alpha))
+    assert results["performance"]["Iavg"] == pytest.approx(100 / (2*np.pi*100) * (1 + math.cos(1.0)), rel=1e-3)
+
+
+def test_uncontrolled_full_wave_small_inductance_is_discontinuous():
+    solver = UncontrolledFullWaveSolver("rle", 100, 50, 100, 1e-4, 50)
+    results = solver.solve()
+
+    assert_finite_results(results)
+    assert not solver.is_continuous
+    assert results["parameters"]["beta"] == pytest.approx(2.6183080, abs=1e-6)
+    assert results["performance"]["Iavg"] == pytest.approx(0.2179955, rel=1e-5)
+
+
+# ---------------------------------------------------------------------------
+# Long time constants: beta is the first extinction after alpha
+# ---------------------------------------------------------------------------
+
+def test_half_wave_large_inductance_first_extinction():
+    results = UncontrolledHalfWaveSolver("rle", 100, 60, 10, 0.1, 0).solve()
+
+    assert results["parameters"]["beta"] == pytest.approx(4.7321881, abs=1e-6)
+    assert results["performance"]["Iavg"] == pytest.approx(1.5600402, rel=1e-6)
+
+
+def test_uncontrolled_full_wave_large_inductance_first_extinction():
+    solver = UncontrolledFullWaveSolver("rle", 200, 60, 2, 0.2, 0)
+    results = solver.solve()
+
+    assert solver.is_continuous
+    assert results["parameters"]["beta"] == pytest.approx(5.719068, abs=1e-6)
+    # Continuous full wave with no Vdc: Iavg = 2*Vm/(pi*R)
+    assert results["performance"]["Iavg"] == pytest.approx(2*200 / (np.pi*2), rel=1e-9)
+
+
+# ---------------------------------------------------------------------------
+# Purely resistive loads (L = 0)
+# ---------------------------------------------------------------------------
+
+def test_freewheeling_resistive_load():
+    results = FreewheelingHalfWaveSolver("fwd", 170, 60, 10, 0).solve()
+
+    assert_finite_results(results)
+    assert results["performance"]["Iavg"] == pytest.approx(170 / (np.pi*10), rel=1e-9)
+    assert results["performance"]["Irms"] == pytest.approx(8.5, rel=1e-9)
+
+
+def test_half_wave_resistive_load():
+    results = UncontrolledHalfWaveSolver("rle", 170, 60, 10, 0, 0).solve()
+
+    assert_finite_results(results)
+    assert results["parameters"]["A"] == 0
+    assert results["parameters"]["beta"] == pytest.approx(np.pi, abs=1e-9)
+    assert results["performance"]["Iavg"] == pytest.approx(170 / (np.pi*10), rel=1e-9)
+    assert results["performance"]["Irms"] == pytest.approx(8.5, rel=1e-9)
+
+
+def test_uncontrolled_full_wave_resistive_load():
+    results = UncontrolledFullWaveSolver("rle", 170, 60, 10, 0, 0).solve()
+
+    assert_finite_results(results)
+    assert results["performance"]["Iavg"] == pytest.approx(2*170 / (np.pi*10), rel=1e-6)
+    assert results["performance"]["Irms"] == pytest.approx(170 / (math.sqrt(2)*10), rel=1e-6)
+
+
+def test_controlled_full_wave_resistive_load():
+    results = ControlledFullWaveSolver("rle", 170, 60, 10, 0, 0, 0.5).solve()
+
+    assert_finite_results(results)
+    assert results["parameters"]["A"] == 0
+    # Each pulse conducts from alpha to pi: Iavg = Vm/(pi*R) * (1 + cos(alpha))
+    assert results["performance"]["Iavg"] == pytest.approx(170 / (np.pi*10) * (1 + math.cos(0.5)), rel=1e-6)
+
+
+# ---------------------------------------------------------------------------
+# Freewheeling closed form against numerical integration
+# ---------------------------------------------------------------------------
+
+@pytest.mark.parametrize("Vm, f, R, L", [(170, 60, 10, 0.05), (100, 50, 5, 0.5), (230, 50, 20, 0.001)])
+def test_freewheeling_closed_form_matches_quadrature(Vm, f, R, L):
+    solver = FreewheelingHalfWaveSolver("fwd", Vm, f, R, L)
+    results = solver.solve()
+
+    def current(wt):
+        return solver.current_function(np.array([wt]))[0]
+
+    # Integrate each half separately: the current's slope jumps at pi
+    Iavg = sum(quad(current, a, b)[0] for a, b in ((0, np.pi), (np.pi, 2*np.pi))) / (2*np.pi)
+    Isq = sum(quad(lambda wt: current(wt)**2, a, b)[0] for a, b in ((0, np.pi), (np.pi, 2*np.pi))) / (2*np.pi)
+
+    assert results["performance"]["Iavg"] == pytest.approx(Iavg, rel=1e-8)
+    assert results["performance"]["Irms"] == pytest.approx(math.sqrt(Isq), rel=1e-8)
+    # The current is periodic: it ends the period where it started
+    assert current(2*np.pi - 1e-12) == pytest.approx(current(0.0), rel=1e-6)
+
+
+# ---------------------------------------------------------------------------
+# Full-wave conduction mode
+# ---------------------------------------------------------------------------
+
+@pytest.mark.parametrize("args, continuous", [
+    ((200, 60, 2, 0.2, 0), True),
+    ((141, 50, 5, 0.1, 50), True),
+    ((120, 50, 10, 0.05, 100), False),
+    ((100, 50, 100, 1e-4, 50), False),
+])
+def test_uncontrolled_full_wave_classification(args, continuous):
+    solver = UncontrolledFullWaveSolver("rle", *args)
+    solver.solve()
+
+    assert solver.is_continuous is continuous
+
+
+@pytest.mark.parametrize("args, firing_angle, continuous", [
+    ((100, 60, 10, 0.1, 0), 0.5, True),
+    ((100, 60, 10, 0.01, 60), 1.0, False),
+])
+def test_controlled_full_wave_classification(args, firing_angle, continuous):
+    solver = ControlledFullWaveSolver("rle", *args, firing_angle)
+    results = solver.solve()
+
+    assert_finite_results(results)
+    assert bool(solver.is_continuous) is continuous
+
+
+@pytest.mark.parametrize("solver", [
+    ControlledFullWaveSolver("rle", 100, 60, 10, 0.1, 0, 0.5),
+    UncontrolledFullWaveSolver("rle", 200, 60, 2, 0.2, 0),
+])
+def test_full_wave_solve_is_repeatable(solver):
+    # beta must come from the RLE formula, not the previous solve's Fourier series
+    first = solver.solve()["parameters"]["beta"]
+
+    assert solver.solve()["parameters"]["beta"] == first
+
+
+# ---------------------------------------------------------------------------
+# Firing-angle sweeps
+# ---------------------------------------------------------------------------
+
+@pytest.mark.parametrize("args", [
+    (100, 50, 100, 1e-4, 50),
+    (170, 60, 10, 0.1, 20),
+    (120, 50, 10, 0, 30),
+])
+def test_controlled_half_wave_batch_matches_scalar(args):
+    firing_angles = np.linspace(0, 3, 31)
+    batch = ControlledHalfWaveSolver("rle", *args).solve_batch(firing_angles)
+
+    assert np.all(np.isfinite(batch["parameters"]["A"]))
+    for j, firing_angle in enumerate(firing_angles):
+        results = ControlledHalfWaveSolver("rle", *args, firing_angle).solve()
+        for group in ("parameters", "performance"):
+            for name, value in results[group].items():
+                # abs covers ripple factors of ~0, where sqrt(FF**2 - 1) magnifies rounding
+                assert batch[group][name][j] == pytest.approx(value, rel=1e-6, abs=1e-7), (firing_angle, name)
+
+
+# ---------------------------------------------------------------------------
+# Controlled rectifiers fired before alpha_min
+# ---------------------------------------------------------------------------
+
+@pytest.mark.parametrize("solver_class", [ControlledHalfWaveSolver, ControlledFullWaveSolver])
+def test_inoperative_results_are_not_shared(solver_class):
+    solver = solver_class("rle", 100, 50, 10, 0.1, 50, 0.2)
+    results = solver.solve()
+
+    assert solver.circuit_operates is False
+    assert solver.beta == solver.alpha == 0.2
+    assert solver.A == 0
+    assert results["performance"]["Vavg"] == 50
+
+    # A caller editing its copy must not leak into the next response
+    results["parameters"]["beta"] = 99
+    results["waveforms"]["vo"] = None
+    again = solver_class("rle", 100, 50, 10, 0.1, 50, 0.2).solve()
+    assert again["parameters"]["beta"] == 0.2
+    assert again["waveforms"]["vo"] is not None
+    with pytest.raises(ValueError):
+        again["waveforms"]["vo"][0] = 0